@@ -1,10 +1,135 @@
+import functools
+import math
 import numpy as np
-from scipy.optimize import minimize
+from types import MappingProxyType
+from scipy.optimize import minimize_scalar
 from typing import Dict, Any, List
 from datetime import datetime
-from statsmodels.tsa.holtwinters import ExponentialSmoothing
+
+def profit_at(price, p0, q0, e, F, vc, cp, ms, seasonal, qi):
+    """Vectorized profit and quantity; all arguments broadcast against each other"""
+    share = np.clip(ms * (2 - price / cp), 0.0, 1.0)
+    quantity = q0 * (p0 / (price / qi)) ** e * seasonal * share
+    return price * quantity - F - vc * quantity, quantity
+
+def margin_price_bounds(variable_costs, initial_price) -> tuple:
+    """Price bounds ensuring minimum margin; works on scalars and arrays alike"""
+    min_price = variable_costs * 1.1  # Minimum 10% margin
+    max_price = initial_price * 3.0  # Upper limit
+    return (min_price, max_price)
+
+def optimal_prices(min_price, max_price, p0, q0, e, F, vc, cp, ms, seasonal, qi):
+    """Vectorized profit-maximizing price; all arguments broadcast against each other.
+
+    Seasonality only scales demand, so profit can peak only at a bound, at a
+    kink of the clipped market share, or where the derivative vanishes:
+    p = c*e/(e-1) while share is pinned at 1, or a root of
+    b(e-2)p^2 - (e-1)(a+bc)p + eac = 0 while share = a - b*p.
+    """
+    a = 2 * ms
+    b = ms / cp
+    qa = b * (e - 2)
+    qb = -(e - 1) * (a + b * vc)
+    qc = e * a * vc
+    with np.errstate(divide='ignore', invalid='ignore'):
+        disc = np.sqrt(qb ** 2 - 4 * qa * qc)
+        linear_root = -qc / qb
+        roots = [np.where(qa == 0, linear_root, (-qb + sign * disc) / (2 * qa)) for sign in (1, -1)]
+        shape = np.broadcast(min_price, max_price, p0, q0, e, F, vc, cp, ms, seasonal, qi).shape
+        candidates = np.stack([
+            np.broadcast_to(candidate, shape)
+            for candidate in (min_price, max_price, vc * e / (e - 1), 2 * cp, cp * (2 - 1 / ms), *roots)
+        ])
+        profit, _ = profit_at(candidates, p0, q0, e, F, vc, cp, ms, seasonal, qi)
+    # Bounds can reach prices where demand is undefined (e.g. zero), so skip non-finite profits
+    feasible = (candidates >= min_price) & (candidates <= max_price) & np.isfinite(profit)
+    if not feasible.any(axis=0).all():
+        raise ValueError("No price within bounds yields a finite profit")
+    profit = np.where(feasible, profit, -np.inf)
+    return np.take_along_axis(candidates, profit.argmax(axis=0)[np.newaxis], axis=0)[0]
+
+# Shared read-only default so each calculator does not allocate its own copy
+_DEFAULT_SEGMENTS = MappingProxyType({
+    'premium': MappingProxyType({'price_sensitivity': 0.5, 'size': 0.3}),
+    'middle': MappingProxyType({'price_sensitivity': 1.0, 'size': 0.5}),
+    'budget': MappingProxyType({'price_sensitivity': 1.5, 'size': 0.2})
+})
+
+def rounded_rows(columns: Dict[str, Any], decimals: int = 2) -> List[Dict[str, float]]:
+    """Round broadcastable columns in one NumPy call and return them as row dicts"""
+    table = np.round(np.column_stack(np.broadcast_arrays(*columns.values())), decimals)
+    return [dict(zip(columns, row)) for row in table.tolist()]
+
+_SMOOTHING_GRID = np.linspace(0.0, 1.0, 21)
+
+@functools.lru_cache(maxsize=128)
+def fit_demand_model(demands: tuple, smoothing: tuple = (None, None, None)) -> tuple:
+    """Fit additive Holt-Winters smoothing to a demand history and cache the result.
+
+    Every combination of grid smoothing parameters is run through the
+    recursion in the same vectorized pass and the one with the lowest
+    one-step-ahead squared error is kept. smoothing holds fixed (level,
+    trend, seasonal) parameters that replace the grid for that component.
+    Returns the final level, trend and seasonal offsets in forecast order.
+    """
+    y = np.asarray(demands, dtype=float)
+    # A seasonal fit needs two full yearly cycles; use Holt's trend model below that
+    seasonal = len(y) >= 24
+    season_length = 12 if seasonal else 1
+
+    grids = [
+        _SMOOTHING_GRID if value is None else np.array([value])
+        for value in (smoothing if seasonal else smoothing[:2] + (0.0,))
+    ]
+    alpha, beta, gamma = (grid.ravel() for grid in np.meshgrid(*grids, indexing='ij'))
+
+    if seasonal:
+        level = np.full_like(alpha, y[:12].mean())
+        trend = np.full_like(alpha, (y[12:24].mean() - y[:12].mean()) / 12)
+        season = np.tile(y[:12] - y[:12].mean(), (len(alpha), 1))
+    else:
+        slope, intercept = np.polyfit(np.arange(len(y)), y, 1)
+        level = np.full_like(alpha, intercept)
+        trend = np.full_like(alpha, slope)
+        season = np.zeros((len(alpha), 1))
+
+    sse = np.zeros_like(alpha)
+    for t, observed in enumerate(y):
+        s = t % season_length
+        sse += (observed - (level + trend + season[:, s])) ** 2
+        new_level = alpha * (observed - season[:, s]) + (1 - alpha) * (level + trend)
+        trend = beta * (new_level - level) + (1 - beta) * trend
+        season[:, s] = gamma * (observed - new_level) + (1 - gamma) * season[:, s]
+        level = new_level
+
+    best = int(np.argmin(sse))
+    return level[best], trend[best], np.roll(season[best], -(len(y) % season_length))
+
+def forecast_demand(model: tuple, periods: int) -> np.ndarray:
+    """Project a fitted demand model the given number of periods ahead"""
+    level, trend, season = model
+    steps = np.arange(1, periods + 1)
+    return level + steps * trend + season[(steps - 1) % len(season)]
+
+def profit_risk(profits, confidence_level: float, axis: int = -1) -> tuple:
+    """Mean, standard deviation and value at risk of simulated profits along axis"""
+    return (
+        profits.mean(axis=axis),
+        profits.std(axis=axis),
+        np.percentile(profits, (1 - confidence_level) * 100, axis=axis)
+    )
 
 class PricingCalculator:
+    __slots__ = (
+        'initial_price', 'initial_quantity', 'elasticity', 'fixed_costs', 'variable_costs',
+        'competitor_price', 'market_share', 'seasonality_factor', 'quality_index',
+        'market_growth_rate', 'min_margin', 'competitor_responsiveness',
+        'competitor_prices_history', 'market_players', 'segments', '_segment_table',
+        'order_cost', 'holding_cost_rate', 'lead_time', 'historical_prices', 'historical_demands', 'smoothing_params',
+        'risk_tolerance', 'confidence_level', '_rng', '_month_sin', '_seasonal_factor',
+        '_ref_price'
+    )
+
     def __init__(self, data: Dict[str, Any]):
         # Convert all inputs to float
         try:
@@ -28,11 +153,8 @@ class PricingCalculator:
         self.competitor_responsiveness = data.get('competitor_responsiveness', 0.3)
         self.competitor_prices_history = data.get('competitor_prices_history', [])
         self.market_players = data.get('market_players', [])
-        self.segments = data.get('market_segments', {
-            'premium': {'price_sensitivity': 0.5, 'size': 0.3},
-            'middle': {'price_sensitivity': 1.0, 'size': 0.5},
-            'budget': {'price_sensitivity': 1.5, 'size': 0.2}
-        })
+        self.segments = data.get('market_segments', _DEFAULT_SEGMENTS)
+        self._segment_table = None
 
         # Add to existing initializations
         self.order_cost = data.get('order_cost', 100)
@@ -42,100 +164,147 @@ class PricingCalculator:
         # Add to existing initializations
         self.historical_prices = data.get('historical_prices', [])
         self.historical_demands = data.get('historical_demands', [])
+        # Raw (level, trend, seasonal) smoothing overrides, parsed by forecast_optimal_prices
+        self.smoothing_params = (
+            data.get('smoothing_level'), data.get('smoothing_trend'), data.get('smoothing_seasonal')
+        )
 
         # Add to existing initializations
         self.risk_tolerance = data.get('risk_tolerance', 0.5)
         self.confidence_level = data.get('confidence_level', 0.95)
+        self._rng = None
+
+        # Seasonality depends only on the current month, so resolve it once per request
+        self._month_sin = math.sin(2 * math.pi * datetime.now().month / 12)
+        self._seasonal_factor = 1 + self.seasonality_factor * self._month_sin
+
+        # p0 / (p / qi) == (p0 * qi) / p; keeping the ratio form avoids overflowing (p0 * qi) ** e
+        self._ref_price = self.initial_price * self.quality_index
 
     def competitor_impact(self, price: float) -> float:
         """Calculate market share adjustment based on competitor pricing"""
-        try:
-            price_ratio = float(price) / float(self.competitor_price)
-            # Adjust market share based on price difference
-            market_share = self.market_share * (2 - price_ratio)
-            # Ensure market share stays between 0 and 1
-            return max(0.0, min(1.0, market_share))
-        except Exception as e:
-            raise ValueError(f"Error in competitor impact calculation: {str(e)}")
+        # Adjust market share based on price difference
+        market_share = self.market_share * (2 - price / self.competitor_price)
+        # Ensure market share stays between 0 and 1
+        return max(0.0, min(1.0, market_share))
 
     def seasonal_demand_adjustment(self, base_demand: float) -> float:
         """Adjust demand based on seasonality"""
-        try:
-            month = datetime.now().month
-            seasonal_factor = 1 + self.seasonality_factor * np.sin(2 * np.pi * month / 12)
-            return float(base_demand) * seasonal_factor
-        except Exception as e:
-            raise ValueError(f"Error in seasonal adjustment calculation: {str(e)}")
+        return base_demand * self._seasonal_factor
 
     def quality_adjusted_price(self, price: float) -> float:
         """Adjust price perception based on quality index"""
-        try:
-            return float(price) / float(self.quality_index)
-        except Exception as e:
-            raise ValueError(f"Error in quality price adjustment: {str(e)}")
+        return price / self.quality_index
 
     def demand_function(self, price: float) -> float:
         """Calculate quantity demanded at given price using constant elasticity demand function"""
-        try:
-            price = float(price)
-            base_demand = float(self.initial_quantity) * (
-                float(self.initial_price) / self.quality_adjusted_price(price)
-            ) ** float(self.elasticity)
-            seasonal_demand = self.seasonal_demand_adjustment(base_demand)
-            market_share_adjustment = self.competitor_impact(price)
-            return seasonal_demand * market_share_adjustment
-        except Exception as e:
-            raise ValueError(f"Error in demand calculation: {str(e)}")
+        base_demand = self.initial_quantity * (self._ref_price / price) ** self.elasticity
+        return self.seasonal_demand_adjustment(base_demand) * self.competitor_impact(price)
 
     def revenue_function(self, price: float) -> float:
         """Calculate revenue at given price"""
-        try:
-            quantity = self.demand_function(float(price))
-            return float(price) * quantity
-        except Exception as e:
-            raise ValueError(f"Error in revenue calculation: {str(e)}")
+        return price * self.demand_function(price)
 
     def cost_function(self, quantity: float) -> float:
         """Calculate total costs for given quantity"""
-        try:
-            return float(self.fixed_costs) + (float(self.variable_costs) * float(quantity))
-        except Exception as e:
-            raise ValueError(f"Error in cost calculation: {str(e)}")
+        return self.fixed_costs + self.variable_costs * quantity
 
     def profit_function(self, price: float) -> float:
         """Calculate profit at given price"""
-        try:
-            quantity = self.demand_function(float(price))
-            revenue = self.revenue_function(float(price))
-            costs = self.cost_function(quantity)
-            return revenue - costs
-        except Exception as e:
-            raise ValueError(f"Error in profit calculation: {str(e)}")
+        quantity = self.demand_function(price)
+        return price * quantity - self.cost_function(quantity)
+
+    def segment_table(self) -> tuple:
+        """Unpack segment names, sizes and price sensitivities into arrays on first use"""
+        if self._segment_table is None:
+            try:
+                self._segment_table = (
+                    list(self.segments.keys()),
+                    np.array([s['size'] for s in self.segments.values()], dtype=float),
+                    np.array([s['price_sensitivity'] for s in self.segments.values()], dtype=float)
+                )
+            except (AttributeError, KeyError, TypeError, ValueError) as e:
+                raise ValueError(f"Invalid market segments: {str(e)}")
+        return self._segment_table
+
+    def segment_demand(self, price: float) -> Dict[str, float]:
+        """Split demand at given price across market segments by size and price sensitivity"""
+        names, sizes, sensitivities = self.segment_table()
+        quantities = self.initial_quantity * sizes * (
+            self.initial_price / price
+        ) ** (self.elasticity * sensitivities)
+        return dict(zip(names, quantities.tolist()))
+
+    def random_generator(self) -> np.random.Generator:
+        """Create the random generator on first use so deterministic paths skip OS seeding"""
+        if self._rng is None:
+            self._rng = np.random.default_rng()
+        return self._rng
+
+    def predict_competitor_response(self, price_change: float) -> Dict[str, float]:
+        """Simulate which competitors follow a price change and by how much"""
+        n = len(self.market_players)
+        rng = self.random_generator()
+        responds = rng.random(n) < float(self.competitor_responsiveness)
+        magnitudes = rng.uniform(0.5, 1.0, n) * price_change
+        return {
+            player: float(magnitude)
+            for player, respond, magnitude in zip(self.market_players, responds, magnitudes)
+            if respond
+        }
 
     def calculate_price_bounds(self) -> tuple:
         """Calculate price bounds ensuring minimum margin"""
         try:
-            min_price = float(self.variable_costs) * 1.1  # Minimum 10% margin
-            max_price = float(self.initial_price) * 3.0  # Upper limit
-            return (min_price, max_price)
+            return margin_price_bounds(self.variable_costs, self.initial_price)
         except Exception as e:
             raise ValueError(f"Error in price bounds calculation: {str(e)}")
 
+    def profit_args(self) -> tuple:
+        """Arguments for profit_at and optimal_prices after the price"""
+        return (
+            self.initial_price, self.initial_quantity, self.elasticity, self.fixed_costs,
+            self.variable_costs, self.competitor_price, self.market_share,
+            self._seasonal_factor, self.quality_index
+        )
+
+    def closed_form_price(self, price_bounds: tuple) -> float:
+        """Find the profit-maximizing price analytically (requires elasticity > 1)"""
+        try:
+            min_price, max_price = price_bounds
+            return float(optimal_prices(min_price, max_price, *self.profit_args()))
+        except Exception as e:
+            raise ValueError(f"Error in closed-form price calculation: {str(e)}")
+
+    def find_optimal_price(self) -> float:
+        """Find the unrounded price that maximizes profit"""
+        # Get price bounds
+        price_bounds = self.calculate_price_bounds()
+
+        if 1.0 < self.elasticity:
+            return self.closed_form_price(price_bounds)
+
+        # Above twice the competitor price the share is zero and profit is flat,
+        # which would stall the bracketing search
+        min_price, max_price = price_bounds
+        max_price = min(max_price, 2 * self.competitor_price)
+        if max_price <= min_price:
+            return min_price
+
+        # Minimize negative profit (equivalent to maximizing profit)
+        args = self.profit_args()
+        result = minimize_scalar(
+            lambda p: -profit_at(p, *args)[0],
+            bounds=(min_price, max_price),
+            method='bounded',
+            options={'xatol': 1e-4}
+        )
+        return float(result.x)
+
     def calculate_optimal_price(self) -> Dict[str, float]:
         """Find optimal price that maximizes profit"""
         try:
-            # Get price bounds
-            price_bounds = self.calculate_price_bounds()
-            
-            # Minimize negative profit (equivalent to maximizing profit)
-            result = minimize(
-                lambda p: -self.profit_function(float(p[0])), 
-                x0=[float(self.initial_price)],
-                bounds=[price_bounds],
-                method='L-BFGS-B'
-            )
-
-            optimal_price = float(result.x[0])
+            optimal_price = self.find_optimal_price()
             optimal_quantity = self.demand_function(optimal_price)
             
             # Calculate margin
@@ -148,7 +317,7 @@ class PricingCalculator:
                 "profit": round(self.profit_function(optimal_price), 2),
                 "market_share": round(self.competitor_impact(optimal_price), 3),
                 "break_even_point": round(
-                    float(self.fixed_costs) / (optimal_price - float(self.variable_costs)), 
+                    self.fixed_costs / (optimal_price - self.variable_costs),
                     2
                 ),
                 "profit_margin": round(margin, 3),
@@ -156,4 +325,150 @@ class PricingCalculator:
                 "quality_adjusted_price": round(self.quality_adjusted_price(optimal_price), 2)
             }
         except Exception as e:
-            raise ValueError(f"Error in optimization: {str(e)}")
\ No newline at end of file
+            raise ValueError(f"Error in optimization: {str(e)}")
+
+    def optimal_price_sweep(self, variable: str, range_percent: float = 0.2) -> tuple:
+        """Solve the optimal price over a five-point +/- range_percent sweep of one input.
+
+        Returns the swept values, the optimal prices and the profit_at arguments,
+        all broadcastable against each other.
+        """
+        params = {
+            'initial_price': self.initial_price,
+            'initial_quantity': self.initial_quantity,
+            'price_elasticity': self.elasticity,
+            'fixed_costs': self.fixed_costs,
+            'variable_costs': self.variable_costs,
+            'competitor_price': self.competitor_price,
+            'market_share': self.market_share,
+            'seasonality_factor': self.seasonality_factor,
+            'quality_index': self.quality_index
+        }
+        if variable not in params:
+            raise ValueError(f"Unsupported sensitivity variable: {variable}")
+
+        range_percent = float(range_percent)
+        base = params[variable]
+        variations = np.linspace(base * (1 - range_percent), base * (1 + range_percent), 5)
+        params[variable] = variations
+
+        p0 = params['initial_price']
+        vc = params['variable_costs']
+        seasonal = 1 + params['seasonality_factor'] * self._month_sin
+        args = (
+            p0, params['initial_quantity'], params['price_elasticity'], params['fixed_costs'],
+            vc, params['competitor_price'], params['market_share'], seasonal,
+            params['quality_index']
+        )
+        return variations, optimal_prices(*margin_price_bounds(vc, p0), *args), args
+
+    def sensitivity_analysis(self, variable: str, range_percent: float = 0.2) -> List[Dict[str, float]]:
+        """Evaluate the optimal price across a +/- range_percent sweep of one input"""
+        try:
+            variations, prices, args = self.optimal_price_sweep(variable, range_percent)
+            profits, quantities = profit_at(prices, *args)
+            prices, quantities, profits = np.broadcast_arrays(prices, quantities, profits)
+
+            rows = rounded_rows({
+                "optimal_price": prices,
+                "optimal_quantity": quantities,
+                "revenue": prices * quantities,
+                "profit": profits
+            })
+            return [{"value": value, **row} for value, row in zip(np.round(variations, 4).tolist(), rows)]
+        except Exception as e:
+            raise ValueError(f"Error in sensitivity analysis: {str(e)}")
+
+    def sensitivity_risk_analysis(
+        self, variable: str, range_percent: float = 0.2, simulations: int = 1000
+    ) -> List[Dict[str, float]]:
+        """Sensitivity sweep with Monte Carlo profit risk for every sweep point in one array pass"""
+        try:
+            variations, prices, args = self.optimal_price_sweep(variable, range_percent)
+            profits, quantities = profit_at(prices, *args)
+            prices, quantities, profits = np.broadcast_arrays(prices, quantities, profits)
+
+            # Sweep points along rows, demand shocks along columns
+            shocks = self.random_generator().normal(1, 0.2, simulations)
+            price_column, p0, q0, *rest = [np.expand_dims(a, -1) for a in (prices,) + args]
+            shocked_profits, _ = profit_at(price_column, p0, q0 * shocks, *rest)
+
+            expected_profits, profit_stds, values_at_risk = profit_risk(
+                shocked_profits, float(self.confidence_level), axis=1
+            )
+
+            rows = rounded_rows({
+                "optimal_price": prices,
+                "optimal_quantity": quantities,
+                "revenue": prices * quantities,
+                "profit": profits,
+                "expected_profit": expected_profits,
+                "profit_std": profit_stds,
+                "value_at_risk": values_at_risk
+            })
+            return [{"value": value, **row} for value, row in zip(np.round(variations, 4).tolist(), rows)]
+        except Exception as e:
+            raise ValueError(f"Error in sensitivity risk analysis: {str(e)}")
+
+    def calculate_risk_adjusted_price(self, simulations: int = 1000) -> Dict[str, float]:
+        """Simulate independent demand shocks and report profit risk at the optimal price"""
+        try:
+            # Shocks only scale demand, so the optimal price is the same for every draw
+            optimal_price = self.find_optimal_price()
+            shocks = self.random_generator().normal(1, 0.2, simulations)
+            p0, q0, *rest = self.profit_args()
+            profits, _ = profit_at(optimal_price, p0, q0 * shocks, *rest)
+
+            confidence_level = float(self.confidence_level)
+            expected_profit, profit_std, value_at_risk = (
+                float(stat) for stat in profit_risk(profits, confidence_level)
+            )
+
+            return {
+                "optimal_price": round(optimal_price, 2),
+                "expected_profit": round(expected_profit, 2),
+                "profit_std": round(profit_std, 2),
+                "value_at_risk": round(value_at_risk, 2),
+                "confidence_level": confidence_level,
+                "risk_adjusted_profit": round(
+                    expected_profit - (1 - float(self.risk_tolerance)) * profit_std, 2
+                )
+            }
+        except Exception as e:
+            raise ValueError(f"Error in risk analysis: {str(e)}")
+
+    def forecast_optimal_prices(self, periods: int = 12) -> List[Dict[str, float]]:
+        """Forecast demand from history and price each future period"""
+        demands = np.asarray(self.historical_demands, dtype=float)
+        if len(demands) < 4:
+            raise ValueError("At least 4 historical demand observations are required for forecasting")
+
+        try:
+            smoothing = tuple(None if value is None else float(value) for value in self.smoothing_params)
+            if any(value is not None and not 0.0 <= value <= 1.0 for value in smoothing):
+                raise ValueError("Smoothing parameters must be between 0 and 1")
+            periods = int(periods)
+            if periods < 1:
+                raise ValueError("periods must be at least 1")
+
+            model = fit_demand_model(tuple(demands.tolist()), smoothing)
+            forecast = np.maximum(forecast_demand(model, periods), 0.0)
+
+            # Demand scale does not move the optimum, so one price serves every period
+            optimal_price = self.find_optimal_price()
+            profits, quantities = profit_at(
+                optimal_price, self.initial_price, forecast, self.elasticity,
+                self.fixed_costs, self.variable_costs, self.competitor_price,
+                self.market_share, self._seasonal_factor, self.quality_index
+            )
+
+            rows = rounded_rows({
+                "forecasted_demand": forecast,
+                "optimal_price": optimal_price,
+                "optimal_quantity": quantities,
+                "revenue": optimal_price * quantities,
+                "profit": profits
+            })
+            return [{"period": period, **row} for period, row in enumerate(rows, start=1)]
+        except Exception as e:
+            raise ValueError(f"Error in demand forecast: {str(e)}")
\ No newline at end of file
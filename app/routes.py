@@ -1,36 +1,83 @@
+import functools
+import json
+from datetime import datetime
 from flask import jsonify, request
 from app import app
 from app.models import PricingCalculator
 
+REQUIRED_FIELDS = frozenset([
+    'initial_price', 'initial_quantity', 'price_elasticity',
+    'fixed_costs', 'variable_costs', 'competitor_price'
+])
+
+def _is_numeric(value):
+    try:
+        float(value)
+        return True
+    except (ValueError, TypeError):
+        return False
+
+@functools.lru_cache(maxsize=1024)
+def _cached_compute(compute, payload, month):
+    return compute(json.loads(payload))
+
+def cached_compute(compute, data):
+    """Run compute on the request data, reusing results for identical payloads.
+
+    Pass ?fresh=1 (or ?fresh=true) to bypass the cache, e.g. for a new Monte Carlo draw.
+    """
+    if request.args.get('fresh', '').lower() in ('1', 'true'):
+        return compute(data)
+    # Results depend on the current month through seasonality
+    return _cached_compute(compute, json.dumps(data, sort_keys=True), datetime.now().month)
+
+def _simulate(data):
+    return PricingCalculator(data).calculate_optimal_price()
+
+def _sensitivity(data):
+    return PricingCalculator(data['inputs']).sensitivity_analysis(
+        variable=data['variable'],
+        range_percent=data.get('range_percent', 0.2)
+    )
+
+def _analyze(data):
+    return PricingCalculator(data['inputs']).sensitivity_risk_analysis(
+        variable=data['variable'],
+        range_percent=data.get('range_percent', 0.2)
+    )
+
+def _forecast(data):
+    return PricingCalculator(data).forecast_optimal_prices(periods=data.get('periods', 12))
+
+def _risk_analysis(data):
+    return PricingCalculator(data).calculate_risk_adjusted_price()
+
 @app.route('/api/simulate', methods=['POST'])
 def simulate_pricing():
     try:
         data = request.get_json()
         
         # Validate required fields
-        required_fields = [
-            'initial_price', 'initial_quantity', 'price_elasticity',
-            'fixed_costs', 'variable_costs', 'competitor_price'
-        ]
-        
-        for field in required_fields:
-            if field not in data:
-                return jsonify({
-                    "success": False,
-                    "error": f"Missing required field: {field}"
-                }), 400
-            
-            # Validate numeric values
-            try:
-                float(data[field])
-            except (ValueError, TypeError):
-                return jsonify({
-                    "success": False,
-                    "error": f"Invalid numeric value for {field}"
-                }), 400
-
-        calculator = PricingCalculator(data)
-        results = calculator.calculate_optimal_price()
+        missing = sorted(field for field in REQUIRED_FIELDS if field not in data)
+        if missing:
+            return jsonify({
+                "success": False,
+                "error": f"Missing required field{'s' if len(missing) > 1 else ''}: {', '.join(missing)}"
+            }), 400
+
+        # Validate numeric values
+        try:
+            numbers = {field: float(data[field]) for field in REQUIRED_FIELDS}
+        except (ValueError, TypeError):
+            invalid = sorted(field for field in REQUIRED_FIELDS if not _is_numeric(data[field]))
+            return jsonify({
+                "success": False,
+                "error": f"Invalid numeric value{'s' if len(invalid) > 1 else ''} for {', '.join(invalid)}"
+            }), 400
+
+        # Casting first also lets "20" and 20 share a cache entry
+        data = {**data, **numbers}
+        results = cached_compute(_simulate, data)
         return jsonify({"success": True, "data": results}), 200
         
     except ValueError as e:
@@ -52,11 +99,7 @@ def health_check():
 def analyze_sensitivity():
     try:
         data = request.get_json()
-        calculator = PricingCalculator(data['inputs'])
-        sensitivity_results = calculator.sensitivity_analysis(
-            variable=data['variable'],
-            range_percent=data.get('range_percent', 0.2)
-        )
+        sensitivity_results = cached_compute(_sensitivity, data)
         return jsonify({"success": True, "data": sensitivity_results}), 200
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 400
@@ -65,8 +108,7 @@ def analyze_sensitivity():
 def forecast_prices():
     try:
         data = request.get_json()
-        calculator = PricingCalculator(data)
-        forecast = calculator.forecast_optimal_prices(periods=data.get('periods', 12))
+        forecast = cached_compute(_forecast, data)
         return jsonify({"success": True, "data": forecast}), 200
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 400
@@ -75,8 +117,16 @@ def forecast_prices():
 def analyze_risk():
     try:
         data = request.get_json()
-        calculator = PricingCalculator(data)
-        risk_analysis = calculator.calculate_risk_adjusted_price()
+        risk_analysis = cached_compute(_risk_analysis, data)
         return jsonify({"success": True, "data": risk_analysis}), 200
     except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 400 
\ No newline at end of file
+        return jsonify({"success": False, "error": str(e)}), 400 
+
+@app.route('/api/analyze', methods=['POST'])
+def analyze_sensitivity_risk():
+    try:
+        data = request.get_json()
+        analysis = cached_compute(_analyze, data)
+        return jsonify({"success": True, "data": analysis}), 200
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 400
\ No newline at end of file
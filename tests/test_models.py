@@ -0,0 +1,172 @@
+import numpy as np
+import pytest
+from app.models import PricingCalculator, fit_demand_model, forecast_demand, optimal_prices, profit_at
+
+def random_inputs(rng):
+    return {
+        'initial_price': rng.uniform(5, 100),
+        'initial_quantity': rng.uniform(10, 1000),
+        'price_elasticity': rng.uniform(1.05, 4),
+        'fixed_costs': rng.uniform(0, 500),
+        'variable_costs': rng.uniform(1, 50),
+        'competitor_price': rng.uniform(5, 150),
+        'market_share': rng.uniform(0.05, 0.95),
+        'seasonality_factor': rng.uniform(-0.5, 0.5),
+        'quality_index': rng.uniform(0.5, 2)
+    }
+
+def test_optimal_prices_match_dense_grid():
+    rng = np.random.default_rng(0)
+    checked = 0
+    while checked < 200:
+        calculator = PricingCalculator(random_inputs(rng))
+        min_price, max_price = calculator.calculate_price_bounds()
+        if max_price < min_price:
+            continue
+        args = calculator.profit_args()
+
+        price = optimal_prices(min_price, max_price, *args)
+        grid_profits, _ = profit_at(np.linspace(min_price, max_price, 20001), *args)
+        profit, _ = profit_at(price, *args)
+
+        assert min_price <= price <= max_price
+        assert profit >= grid_profits.max() - 1e-9 * max(1.0, abs(profit))
+        checked += 1
+
+def test_optimal_prices_broadcast_over_sweep():
+    calculator = PricingCalculator({
+        'initial_price': 20, 'initial_quantity': 100, 'price_elasticity': 1.8,
+        'fixed_costs': 200, 'variable_costs': 8, 'competitor_price': 22
+    })
+    p0, q0, e, F, vc, cp, ms, seasonal, qi = calculator.profit_args()
+    costs = np.linspace(6, 10, 5)
+
+    prices = optimal_prices(costs * 1.1, p0 * 3.0, p0, q0, e, F, costs, cp, ms, seasonal, qi)
+
+    expected = [
+        optimal_prices(c * 1.1, p0 * 3.0, p0, q0, e, F, c, cp, ms, seasonal, qi) for c in costs
+    ]
+    np.testing.assert_allclose(prices, expected)
+
+def test_zero_variable_costs_skip_undefined_zero_price():
+    calculator = PricingCalculator({
+        'initial_price': 20, 'initial_quantity': 100, 'price_elasticity': 1.8,
+        'fixed_costs': 200, 'variable_costs': 0, 'competitor_price': 22
+    })
+
+    rows = calculator.sensitivity_analysis('initial_price')
+
+    for row in rows:
+        assert row['optimal_price'] > 0
+        assert all(np.isfinite(value) for value in row.values())
+
+def test_optimal_prices_reject_bounds_without_finite_profit():
+    with pytest.raises(ValueError):
+        optimal_prices(0.0, 0.0, 20.0, 100.0, 1.8, 200.0, 0.0, 22.0, 0.5, 1.0, 1.0)
+
+def test_forecast_tracks_trend_and_seasonality():
+    t = np.arange(60)
+    demand = 100 + 0.5 * t + 10 * np.sin(2 * np.pi * t / 12)
+
+    forecast = forecast_demand(fit_demand_model(tuple(demand[:42])), 12)
+
+    rmse = np.sqrt(np.mean((forecast - demand[42:54]) ** 2))
+    assert rmse < 2.5
+
+def test_forecast_extends_linear_trend_for_short_history():
+    demand = 50 + 2 * np.arange(15.0)
+
+    forecast = forecast_demand(fit_demand_model(tuple(demand[:10])), 5)
+
+    np.testing.assert_allclose(forecast, demand[10:])
+
+def test_fixed_smoothing_parameters_are_used():
+    t = np.arange(36)
+    demand = tuple(100 + 0.5 * t + 10 * np.sin(2 * np.pi * t / 12))
+
+    fitted = forecast_demand(fit_demand_model(demand), 3)
+    fixed = forecast_demand(fit_demand_model(demand, (0.9, 0.9, 0.9)), 3)
+
+    assert not np.allclose(fitted, fixed)
+
+def test_predict_competitor_response_is_seeded_and_bounded():
+    calculator = PricingCalculator({
+        'initial_price': 20, 'initial_quantity': 100, 'price_elasticity': 1.8,
+        'fixed_costs': 200, 'variable_costs': 8, 'competitor_price': 22,
+        'market_players': ['a', 'b', 'c', 'd', 'e', 'f'], 'competitor_responsiveness': '0.5'
+    })
+    calculator._rng = np.random.default_rng(0)
+    expected_players = [
+        player for player, draw in zip('abcdef', np.random.default_rng(0).random(6)) if draw < 0.5
+    ]
+
+    response = calculator.predict_competitor_response(-4.0)
+
+    assert list(response) == expected_players
+    assert all(-4.0 <= magnitude <= -2.0 for magnitude in response.values())
+
+def test_segment_demand_splits_initial_quantity():
+    calculator = PricingCalculator({
+        'initial_price': 20, 'initial_quantity': 100, 'price_elasticity': 1.8,
+        'fixed_costs': 200, 'variable_costs': 8, 'competitor_price': 22
+    })
+
+    at_initial_price = calculator.segment_demand(20)
+    raised = calculator.segment_demand(25)
+
+    assert sum(at_initial_price.values()) == pytest.approx(100)
+    budget_drop = raised['budget'] / at_initial_price['budget']
+    premium_drop = raised['premium'] / at_initial_price['premium']
+    assert budget_drop < premium_drop < 1
+
+def test_malformed_segments_fail_only_in_segment_demand():
+    calculator = PricingCalculator({
+        'initial_price': 20, 'initial_quantity': 100, 'price_elasticity': 1.8,
+        'fixed_costs': 200, 'variable_costs': 8, 'competitor_price': 22,
+        'market_segments': {'a': {'size': 1}}
+    })
+
+    with pytest.raises(ValueError):
+        calculator.segment_demand(20)
+
+@pytest.mark.parametrize('periods', [0, -3])
+def test_forecast_rejects_non_positive_periods(periods):
+    calculator = PricingCalculator({
+        'initial_price': 20, 'initial_quantity': 100, 'price_elasticity': 1.8,
+        'fixed_costs': 200, 'variable_costs': 8, 'competitor_price': 22,
+        'historical_demands': list(range(100, 112))
+    })
+
+    with pytest.raises(ValueError, match='periods must be at least 1'):
+        calculator.forecast_optimal_prices(periods)
+
+def test_risk_adjusted_price_does_not_compound_shocks():
+    calculator = PricingCalculator({
+        'initial_price': 20, 'initial_quantity': 100, 'price_elasticity': 1.8,
+        'fixed_costs': 200, 'variable_costs': 8, 'competitor_price': 22
+    })
+    calculator._rng = np.random.default_rng(0)
+
+    risk = calculator.calculate_risk_adjusted_price()
+
+    assert risk['value_at_risk'] <= risk['expected_profit']
+    assert calculator.initial_quantity == 100
+
+def test_sensitivity_risk_analysis_matches_sensitivity_sweep():
+    inputs = {
+        'initial_price': 20, 'initial_quantity': 100, 'price_elasticity': 1.8,
+        'fixed_costs': 200, 'variable_costs': 8, 'competitor_price': 22
+    }
+    calculator = PricingCalculator(inputs)
+    calculator._rng = np.random.default_rng(0)
+
+    risk_rows = calculator.sensitivity_risk_analysis('variable_costs')
+    sweep_rows = PricingCalculator(inputs).sensitivity_analysis('variable_costs')
+
+    for risk_row, sweep_row in zip(risk_rows, sweep_rows):
+        assert risk_row['optimal_price'] == sweep_row['optimal_price']
+        assert risk_row['profit'] == sweep_row['profit']
+        # Shocks have unit mean, so the simulated mean stays near the deterministic profit
+        standard_error = risk_row['profit_std'] / np.sqrt(1000)
+        assert abs(risk_row['expected_profit'] - risk_row['profit']) <= 4 * standard_error + 0.01
+        assert risk_row['value_at_risk'] <= risk_row['expected_profit']
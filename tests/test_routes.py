@@ -0,0 +1,107 @@
+from datetime import datetime
+import numpy as np
+import pytest
+from flask import Flask, json, jsonify
+from app import OrjsonProvider, app, routes
+
+INPUTS = {
+    'initial_price': 20, 'initial_quantity': 100, 'price_elasticity': 1.8,
+    'fixed_costs': 200, 'variable_costs': 8, 'competitor_price': 22
+}
+
+@pytest.fixture
+def client():
+    routes._cached_compute.cache_clear()
+    yield app.test_client()
+    routes._cached_compute.cache_clear()
+
+def risk_analysis(client, query=''):
+    response = client.post('/api/risk-analysis' + query, json=INPUTS)
+    assert response.status_code == 200
+    return response.get_json()['data']
+
+def make_app(provider=True):
+    test_app = Flask(__name__)
+    if provider:
+        test_app.json = OrjsonProvider(test_app)
+
+    @test_app.route('/numpy')
+    def numpy_values():
+        return jsonify({"zeta": np.float64(1.5), "alpha": np.arange(3)})
+
+    @test_app.route('/positional')
+    def positional():
+        return jsonify(1, "two")
+
+    @test_app.route('/keywords')
+    def keywords():
+        return jsonify(b=2, a=1)
+
+    @test_app.route('/empty')
+    def empty():
+        return jsonify()
+
+    return test_app
+
+def test_orjson_response_is_sorted_json_bytes():
+    response = make_app().test_client().get('/numpy')
+
+    assert response.mimetype == 'application/json'
+    assert isinstance(response.data, bytes)
+    assert response.data == b'{"alpha":[0,1,2],"zeta":1.5}'
+
+def test_orjson_jsonify_arguments_match_flask():
+    orjson_client = make_app().test_client()
+    flask_client = make_app(provider=False).test_client()
+
+    for path in ('/positional', '/keywords', '/empty'):
+        assert json.loads(orjson_client.get(path).data) == json.loads(flask_client.get(path).data)
+
+def test_identical_payload_returns_cached_result(client):
+    assert risk_analysis(client) == risk_analysis(client)
+
+@pytest.mark.parametrize('fresh', ['1', 'true'])
+def test_fresh_bypasses_cache(client, fresh):
+    cached = risk_analysis(client)
+
+    assert risk_analysis(client, f'?fresh={fresh}') != cached
+    assert risk_analysis(client) == cached
+
+def test_fresh_zero_uses_cache(client):
+    assert risk_analysis(client, '?fresh=0') == risk_analysis(client, '?fresh=0')
+
+def test_cache_key_includes_month(client, monkeypatch):
+    class FixedMonth:
+        month = 1
+
+        @classmethod
+        def now(cls):
+            return datetime(2024, cls.month, 1)
+
+    monkeypatch.setattr(routes, 'datetime', FixedMonth)
+    january = risk_analysis(client)
+    FixedMonth.month = 2
+
+    assert risk_analysis(client) != january
+
+@pytest.mark.parametrize('overrides, error', [
+    ({'fixed_costs': None}, 'Invalid numeric value for fixed_costs'),
+    ({'fixed_costs': 'x', 'variable_costs': 'y'}, 'Invalid numeric values for fixed_costs, variable_costs'),
+])
+def test_simulate_reports_invalid_fields(client, overrides, error):
+    response = client.post('/api/simulate', json={**INPUTS, **overrides})
+
+    assert response.status_code == 400
+    assert response.get_json()['error'] == error
+
+@pytest.mark.parametrize('removed, error', [
+    (['fixed_costs'], 'Missing required field: fixed_costs'),
+    (['fixed_costs', 'variable_costs'], 'Missing required fields: fixed_costs, variable_costs'),
+])
+def test_simulate_reports_missing_fields(client, removed, error):
+    payload = {key: value for key, value in INPUTS.items() if key not in removed}
+
+    response = client.post('/api/simulate', json=payload)
+
+    assert response.status_code == 400
+    assert response.get_json()['error'] == error